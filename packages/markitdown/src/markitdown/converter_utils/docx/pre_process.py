@@ -1,3 +1,4 @@
+import shutil
 import zipfile
 from io import BytesIO
 from typing import BinaryIO
@@ -128,8 +129,9 @@ def pre_process_docx(input_docx: BinaryIO) -> BinaryIO:
 
     Returns:
         BinaryIO: A binary output stream representing the processed DOCX file.
+        When no pre-processing is needed, this is the original input stream
+        rewound to the start, so the archive is never copied.
     """
-    output_docx = BytesIO()
     # The files that need to be pre-processed from .docx
     pre_process_enable_files = [
         "word/document.xml",
@@ -137,20 +139,40 @@ def pre_process_docx(input_docx: BinaryIO) -> BinaryIO:
         "word/endnotes.xml",
     ]
     with zipfile.ZipFile(input_docx, mode="r") as zip_input:
-        files = {name: zip_input.read(name) for name in zip_input.namelist()}
+        names = set(zip_input.namelist())
+        contents = {
+            name: zip_input.read(name)
+            for name in pre_process_enable_files
+            if name in names
+        }
+
+        # Fast path: without math markup there is nothing to rewrite, so
+        # mammoth can consume the original stream directly instead of a
+        # second in-memory copy of the whole archive
+        if not any(b"oMath" in content for content in contents.values()):
+            input_docx.seek(0)
+            return input_docx
+
+        output_docx = BytesIO()
         with zipfile.ZipFile(output_docx, mode="w") as zip_output:
             zip_output.comment = zip_input.comment
-            for name, content in files.items():
-                if name in pre_process_enable_files:
+            for info in zip_input.infolist():
+                if info.filename in contents:
+                    content = contents[info.filename]
                     try:
                         # Pre-process the content
                         updated_content = _pre_process_math(content)
                         # In the future, if there are more pre-processing steps, they can be added here
-                        zip_output.writestr(name, updated_content)
+                        zip_output.writestr(info.filename, updated_content)
                     except:
                         # If there is an error in processing the content, write the original content
-                        zip_output.writestr(name, content)
+                        zip_output.writestr(info.filename, content)
                 else:
-                    zip_output.writestr(name, content)
+                    # Stream all other entries (notably embedded media) from
+                    # the input archive to the output archive chunk by chunk,
+                    # so only one entry's worth of data is in memory at a time
+                    with zip_input.open(info, mode="r") as entry_input:
+                        with zip_output.open(info, mode="w") as entry_output:
+                            shutil.copyfileobj(entry_input, entry_output)
     output_docx.seek(0)
     return output_docx
@@ -3,11 +3,14 @@ import os
 import re
 import base64
 import hashlib
+import logging
+import mmap
+import string
 import unicodedata
-from typing import BinaryIO, Any, Dict, List, Tuple
-from io import BytesIO
+from typing import BinaryIO, Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from io import RawIOBase
 import json
-from bs4 import BeautifulSoup
 
 from ._html_converter import HtmlConverter
 from ..converter_utils.docx.pre_process import pre_process_docx
@@ -15,6 +18,8 @@ from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
 
+logger = logging.getLogger(__name__)
+
 # Try loading optional (but in this case, required) dependencies
 # Save reporting of any exceptions for later
 _dependency_exc_info = None
@@ -24,6 +29,15 @@ except ImportError:
     # Preserve the error and stack trace for later
     _dependency_exc_info = sys.exc_info()
 
+# Optionally use pybase64's SIMD-accelerated decoder for the embedded image
+# payloads; fall back to the stdlib decoder when it isn't installed
+try:
+    import pybase64
+
+    _b64decode = pybase64.b64decode
+except ImportError:
+    _b64decode = base64.b64decode
+
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
@@ -31,6 +45,92 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".docx"]
 
+# Precomputed lookup forms: set membership for extensions, and a tuple so
+# str.startswith checks all MIME prefixes in a single C-level call
+_ACCEPTED_EXTENSIONS = frozenset(ACCEPTED_FILE_EXTENSIONS)
+_ACCEPTED_MIME_PREFIXES = tuple(ACCEPTED_MIME_TYPE_PREFIXES)
+
+# Matches <img> tags with a base64 data URI in src or data-src, capturing
+# the full URI and the base64 payload. Used to rewrite images in a single
+# pass over the HTML instead of building and reserializing a full DOM
+_DATA_IMG_RE = re.compile(
+    r'<img\b[^>]*?\b(?:data-)?src="(data:image/[^;"]+;base64,([^"]+))"[^>]*?/?>',
+    re.IGNORECASE,
+)
+
+# Matches a non-empty alt attribute inside an <img> tag
+_ALT_RE = re.compile(r'\balt="[^"]+"', re.IGNORECASE)
+
+# Filename sanitization tables, hoisted so per-call use skips rebuilding
+# them. Every ASCII character outside the safe set maps to an underscore
+_SAFE_FILENAME_CHARS = set(string.ascii_letters + string.digits + "-._")
+_SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if c not in _SAFE_FILENAME_CHARS}
+)
+_UNDERSCORE_RE = re.compile(r"_+")
+
+# Extensions for the image MIME types mammoth embeds
+_MIME_EXT = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/gif": ".gif",
+}
+
+
+class _MmapReader(RawIOBase):
+    """
+    Minimal read-only file wrapper around an mmap, adding the seekable()
+    and readable() probes that zipfile requires but mmap doesn't provide
+    """
+
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._mm.read(size)
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        self._mm.seek(pos, whence)  # type: ignore[arg-type]
+        return self._mm.tell()
+
+    def tell(self) -> int:
+        return self._mm.tell()
+
+    def close(self) -> None:
+        try:
+            self._mm.close()
+        finally:
+            super().close()
+
+
+# Flags for image writes: O_CLOEXEC keeps the fd out of subprocesses and
+# O_NOFOLLOW refuses to write through a symlink planted at the target path.
+# Both are no-ops on platforms that don't define them
+_IMAGE_OPEN_FLAGS = (
+    os.O_WRONLY
+    | os.O_CREAT
+    | os.O_TRUNC
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_NOFOLLOW", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+
+
+def _write_image_file(path: str, data: bytes) -> None:
+    """Write image bytes with a single unbuffered write syscall."""
+    fd = os.open(path, _IMAGE_OPEN_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 
 class DocxConverter(HtmlConverter):
     """
@@ -38,10 +138,6 @@ class DocxConverter(HtmlConverter):
     Extracts images from documents and saves them to document-specific subfolders.
     """
 
-    def __init__(self):
-        super().__init__()
-        self._html_converter = HtmlConverter()
-
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -51,12 +147,11 @@ class DocxConverter(HtmlConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if extension in ACCEPTED_FILE_EXTENSIONS:
+        if extension in _ACCEPTED_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(_ACCEPTED_MIME_PREFIXES):
+            return True
 
         return False
 
@@ -70,24 +165,25 @@ class DocxConverter(HtmlConverter):
         Returns:
             A sanitized filename safe for filesystem use
         """
-        # Step 1: Normalize unicode characters
-        filename = unicodedata.normalize("NFKD", filename)
-
-        # Step 2: Remove invalid characters and replace spaces with underscores
-        # Keep alphanumeric characters, underscores, hyphens, and periods
-        sanitized = re.sub(r"[^\w\-\.]", "_", filename)
-
-        # Step 3: Collapse multiple underscores
-        sanitized = re.sub(r"_+", "_", sanitized)
+        # Step 1: Normalize unicode and drop what doesn't survive the trip
+        # to ASCII (e.g. accents decompose to base letter + combining mark,
+        # and the mark is discarded: "évaluation" -> "evaluation")
+        sanitized = (
+            unicodedata.normalize("NFKD", filename)
+            .encode("ascii", "ignore")
+            .decode("ascii")
+        )
 
-        # Step 4: Remove leading/trailing underscores
-        sanitized = sanitized.strip("_")
+        # Step 2: Map remaining unsafe characters to underscores in a single
+        # translate pass, keeping alphanumerics, underscores, hyphens, and
+        # periods
+        sanitized = sanitized.translate(_SANITIZE_TABLE)
 
-        # Step 5: Ensure we have a valid filename (default if empty)
-        if not sanitized:
-            sanitized = "unnamed"
+        # Step 3: Collapse multiple underscores and trim the ends
+        sanitized = _UNDERSCORE_RE.sub("_", sanitized).strip("_")
 
-        return sanitized
+        # Step 4: Ensure we have a valid filename (default if empty)
+        return sanitized or "unnamed"
 
     def _get_document_name(self, stream_info: StreamInfo) -> str:
         """
@@ -111,7 +207,11 @@ class DocxConverter(HtmlConverter):
         return "docx_document"
 
     def _extract_and_save_images(
-        self, html_content: str, doc_folder: str, assets_folder: str = "assets"
+        self,
+        html_content: str,
+        doc_folder: str,
+        assets_folder: str = "assets",
+        seen: Optional[Dict[str, Tuple[str, str]]] = None,
     ) -> str:
         """
         Extract base64 images from HTML content, save them to filesystem, and update HTML with new image paths
@@ -120,66 +220,93 @@ class DocxConverter(HtmlConverter):
             html_content: The HTML content containing images
             doc_folder: The document-specific folder name
             assets_folder: The base folder for assets
+            seen: Cache mapping base64 payloads to (new_src, hashname) so
+                repeated images are decoded and written only once
 
         Returns:
             Updated HTML content with image references pointing to saved files
         """
-        # Parse HTML
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Find all images
-        images = soup.find_all("img")
-        if not images:
+        # Fast path: no embedded images, nothing to rewrite
+        if "data:image" not in html_content:
             return html_content
 
         # Create output directory
         output_dir = os.path.join(assets_folder, doc_folder)
         os.makedirs(output_dir, exist_ok=True)
 
-        # Process each image
-        for img in images:
-            src = img.get("src", "") or img.get("data-src", "")
-            if not src or not src.startswith("data:image"):
-                continue
-
+        if seen is None:
+            seen = {}
+
+        # Phase 1: decode each distinct payload and queue its write, so the
+        # I/O of one image overlaps with decoding the next (the GIL is
+        # released during the write syscall). DOCX files routinely repeat
+        # the same logo/icon many times; each payload is handled once
+        pending: Dict[str, Tuple[Any, str, str]] = {}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for match in _DATA_IMG_RE.finditer(html_content):
+                src = match.group(1)
+                encoded_data = match.group(2)
+                if encoded_data in seen or encoded_data in pending:
+                    continue
+
+                try:
+                    # Parse image data
+                    mime_type = src.split(";", 1)[0].replace("data:", "")
+
+                    # Get file extension
+                    ext = _MIME_EXT.get(mime_type, ".png")
+
+                    # Decode the base64 payload; hand the decoder ASCII
+                    # bytes directly so pybase64 can stay on its fast path
+                    image_data = _b64decode(encoded_data.encode("ascii"))
+
+                    # Generate unique filename. A 4-byte truncated BLAKE2b
+                    # is cheaper than SHA-256 and yields exactly the 8 hex
+                    # chars we keep; collisions only matter for in-document
+                    # dedupe
+                    hashname = hashlib.blake2b(image_data, digest_size=4).hexdigest()
+                    filename = f"image_{hashname}{ext}"
+                    filepath = os.path.join(output_dir, filename)
+
+                    pending[encoded_data] = (
+                        pool.submit(_write_image_file, filepath, image_data),
+                        filepath.replace("\\", "/"),
+                        hashname,
+                    )
+                except Exception:
+                    continue
+
+        # The pool has shut down, so every queued write has finished; keep
+        # only the images that actually reached disk. Failed images retain
+        # their data URIs in the HTML rather than pointing at missing files
+        for encoded_data, (future, new_src, hashname) in pending.items():
             try:
-                # Parse image data
-                mime_type = src.split(";")[0].replace("data:", "")
-
-                # Get file extension
-                ext = {
-                    "image/png": ".png",
-                    "image/jpeg": ".jpg",
-                    "image/jpg": ".jpg",
-                    "image/gif": ".gif",
-                }.get(mime_type, ".png")
-
-                # Extract base64 data
-                encoded_data = src.split(",", 1)[1]
-                image_data = base64.b64decode(encoded_data)
-
-                # Generate unique filename
-                hashname = hashlib.sha256(image_data).hexdigest()[:8]
-                filename = f"image_{hashname}{ext}"
-
-                # Save file
-                filepath = os.path.join(output_dir, filename)
-                with open(filepath, "wb") as f:
-                    f.write(image_data)
-
-                # Update image src in HTML
-                new_src = os.path.join(output_dir, filename).replace("\\", "/")
-                img["src"] = new_src
-
-                # Add alt text if empty
-                if not img.get("alt"):
-                    img["alt"] = f"image_{hashname}"
-
+                future.result()
             except Exception as e:
+                logger.warning("Failed to save image %s: %s", new_src, e)
                 continue
+            seen[encoded_data] = (new_src, hashname)
+
+        # Phase 2: rewrite the successfully saved images in one linear pass
+        # over the string, avoiding a BeautifulSoup parse + reserialize
+        # round-trip
+        def _replace_img(match: "re.Match[str]") -> str:
+            tag = match.group(0)
+            cached = seen.get(match.group(2))
+            if cached is None:
+                return tag
+
+            new_src, hashname = cached
+            tag = tag.replace(match.group(1), new_src, 1)
+
+            # Add alt text if missing or empty
+            if not _ALT_RE.search(tag):
+                tag = tag.replace('alt=""', "", 1)
+                tag = tag.replace("<img", f'<img alt="image_{hashname}"', 1)
+
+            return tag
 
-        # Return updated HTML
-        return str(soup)
+        return _DATA_IMG_RE.sub(_replace_img, html_content)
 
     def convert(
         self,
@@ -209,29 +336,56 @@ class DocxConverter(HtmlConverter):
         # Get assets folder
         assets_folder = kwargs.get("image_output_dir", "assets")
 
-        # Convert DOCX to HTML
+        # Convert DOCX to HTML. The style_map must be passed as text:
+        # mammoth's read_options() re-parses the style-map DSL on every call
+        # and rejects pre-parsed mappings, so it cannot be compiled once and
+        # reused across documents without reaching into mammoth internals
         style_map = kwargs.get("style_map", None)
-        pre_process_stream = pre_process_docx(file_stream)
-        html_content = mammoth.convert_to_html(
-            pre_process_stream, style_map=style_map
-        ).value
-
-        # Extract and save images, getting updated HTML with correct image references
-        processed_html = self._extract_and_save_images(
-            html_content, doc_name, assets_folder
-        )
 
-        # Create a new StreamInfo for the HTML converter
-        html_stream_info = stream_info.copy_and_update(
-            mimetype="text/html", extension=".html"
-        )
+        # When the stream is backed by a real file, memory-map it so the zip
+        # reader pages data straight from the OS cache instead of copying
+        # the whole file through read(). Fall back to the stream as-is for
+        # BytesIO and other fd-less sources
+        docx_stream: Any = file_stream
+        try:
+            docx_stream = _MmapReader(
+                mmap.mmap(file_stream.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+        except (AttributeError, ValueError, OSError):
+            pass
+
+        try:
+            pre_process_stream = pre_process_docx(docx_stream)
+            html_content = mammoth.convert_to_html(
+                pre_process_stream, style_map=style_map
+            ).value
+        finally:
+            # pre_process_docx may hand back the original stream, so the
+            # mmap has to stay alive until mammoth has consumed it
+            if docx_stream is not file_stream:
+                docx_stream.close()
+
+        # Exactly one image strategy runs per conversion: when the caller
+        # asks to keep data URIs, leave the HTML untouched so the markdown
+        # pass preserves them; otherwise extract the images to files here,
+        # after which the markdown pass has no data URIs left to handle
+        if kwargs.get("keep_data_uris", False):
+            processed_html = html_content
+        else:
+            # The cache is per-conversion so identical images are only
+            # decoded and written once
+            seen: Dict[str, Tuple[str, str]] = {}
+            processed_html = self._extract_and_save_images(
+                html_content, doc_name, assets_folder, seen=seen
+            )
 
-        # Use the standard HTML converter to convert to Markdown
+        # Use the standard HTML converter to convert to Markdown, handing it
+        # the string directly rather than re-encoding to a byte stream.
         # We don't need to pass conversion_name because images are already extracted
         html_kwargs = {k: v for k, v in kwargs.items() if k != "conversion_name"}
 
-        return self._html_converter.convert(
-            file_stream=BytesIO(processed_html.encode("utf-8")),
-            stream_info=html_stream_info,
+        return self.convert_string(
+            processed_html,
+            url=stream_info.url,
             **html_kwargs,
         )
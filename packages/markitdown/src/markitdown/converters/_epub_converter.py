@@ -16,6 +16,11 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".epub"]
 
+# Precomputed lookup forms: set membership for extensions, and a tuple so
+# str.startswith checks all MIME prefixes in a single C-level call
+_ACCEPTED_EXTENSIONS = frozenset(ACCEPTED_FILE_EXTENSIONS)
+_ACCEPTED_MIME_PREFIXES = tuple(ACCEPTED_MIME_TYPE_PREFIXES)
+
 MIME_TYPE_MAPPING = {
     ".html": "text/html",
     ".xhtml": "application/xhtml+xml",
@@ -40,12 +45,11 @@ class EpubConverter(HtmlConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if extension in ACCEPTED_FILE_EXTENSIONS:
+        if extension in _ACCEPTED_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(_ACCEPTED_MIME_PREFIXES):
+            return True
 
         return False
 
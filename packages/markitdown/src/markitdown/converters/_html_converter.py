@@ -1,5 +1,4 @@
-import io
-from typing import Any, BinaryIO, Optional
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
@@ -16,6 +15,41 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+# Precomputed lookup forms: set membership for extensions, and a tuple so
+# str.startswith checks all MIME prefixes in a single C-level call
+_ACCEPTED_EXTENSIONS = frozenset(ACCEPTED_FILE_EXTENSIONS)
+_ACCEPTED_MIME_PREFIXES = tuple(ACCEPTED_MIME_TYPE_PREFIXES)
+
+
+# Prefer lxml's C parser when it is installed; fall back to the stdlib
+# html.parser otherwise
+try:
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Markdownify converters reused across documents, keyed on their frozen
+# options. Instantiation re-parses options and rebuilds markdownify's
+# internal tables, and the instances hold no per-document state, so batch
+# conversions can share one per distinct option set
+_MD_CONVERTERS: Dict[Tuple, _CustomMarkdownify] = {}
+
+
+def _get_markdownify(**options: Any) -> _CustomMarkdownify:
+    try:
+        key = tuple(sorted(options.items()))
+        hash(key)
+    except TypeError:
+        # Unhashable option values (e.g. lists) can't key the pool
+        return _CustomMarkdownify(**options)
+
+    converter = _MD_CONVERTERS.get(key)
+    if converter is None:
+        converter = _MD_CONVERTERS[key] = _CustomMarkdownify(**options)
+    return converter
+
 
 class HtmlConverter(DocumentConverter):
     """Anything with content type text/html"""
@@ -29,12 +63,11 @@ class HtmlConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if extension in ACCEPTED_FILE_EXTENSIONS:
+        if extension in _ACCEPTED_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(_ACCEPTED_MIME_PREFIXES):
+            return True
 
         return False
 
@@ -46,8 +79,14 @@ class HtmlConverter(DocumentConverter):
     ) -> DocumentConverterResult:
         # Parse the stream
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        soup = BeautifulSoup(file_stream, _HTML_PARSER, from_encoding=encoding)
+        return self._convert_soup(soup, **kwargs)
 
+    def _convert_soup(
+        self,
+        soup: Any,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> DocumentConverterResult:
         # Remove javascript and style blocks
         for script in soup(["script", "style"]):
             script.extract()
@@ -56,9 +95,9 @@ class HtmlConverter(DocumentConverter):
         body_elm = soup.find("body")
         webpage_text = ""
         if body_elm:
-            webpage_text = _CustomMarkdownify(**kwargs).convert_soup(body_elm)
+            webpage_text = _get_markdownify(**kwargs).convert_soup(body_elm)
         else:
-            webpage_text = _CustomMarkdownify(**kwargs).convert_soup(soup)
+            webpage_text = _get_markdownify(**kwargs).convert_soup(soup)
 
         assert isinstance(webpage_text, str)
 
@@ -78,13 +117,7 @@ class HtmlConverter(DocumentConverter):
         Given that many converters produce HTML as intermediate output, this
         allows for easy conversion of HTML to markdown.
         """
-        return self.convert(
-            file_stream=io.BytesIO(html_content.encode("utf-8")),
-            stream_info=StreamInfo(
-                mimetype="text/html",
-                extension=".html",
-                charset="utf-8",
-                url=url,
-            ),
-            **kwargs,
-        )
+        # BeautifulSoup accepts str directly; parsing the string in place
+        # skips an encode to bytes here and a decode back inside convert()
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
+        return self._convert_soup(soup, **kwargs)
@@ -5,6 +5,15 @@ from typing import Any, Optional
 from urllib.parse import quote, unquote, urlparse, urlunparse
 
 
+def _title_part(title: Optional[str]) -> str:
+    """Format a link/image title, escaping quotes only when present."""
+    if not title:
+        return ""
+    if '"' in title:
+        title = title.replace('"', r"\"")
+    return ' "%s"' % title
+
+
 class _CustomMarkdownify(markdownify.MarkdownConverter):
     """
     A custom version of markdownify's MarkdownConverter. Changes include:
@@ -56,13 +65,18 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
 
         # Escape URIs and skip non-http or file schemes
         if href:
-            try:
-                parsed_url = urlparse(href)  # type: ignore
-                if parsed_url.scheme and parsed_url.scheme.lower() not in ["http", "https", "file"]:  # type: ignore
+            # Fast-reject before paying for urlparse: mammoth-produced HTML
+            # is dominated by internal bookmarks like "#_Toc12345". Only
+            # bare fragments can skip the parse — anything else still needs
+            # the scheme vetted and its path escaped
+            if not href.startswith("#"):
+                try:
+                    parsed_url = urlparse(href)  # type: ignore
+                    if parsed_url.scheme and parsed_url.scheme.lower() not in ["http", "https", "file"]:  # type: ignore
+                        return "%s%s%s" % (prefix, text, suffix)
+                    href = urlunparse(parsed_url._replace(path=quote(unquote(parsed_url.path))))  # type: ignore
+                except ValueError:  # It's not clear if this ever gets thrown
                     return "%s%s%s" % (prefix, text, suffix)
-                href = urlunparse(parsed_url._replace(path=quote(unquote(parsed_url.path))))  # type: ignore
-            except ValueError:  # It's not clear if this ever gets thrown
-                return "%s%s%s" % (prefix, text, suffix)
 
         # For the replacement see #29: text nodes underscores are escaped
         if (
@@ -75,7 +89,7 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
             return "<%s>" % href
         if self.options["default_title"] and not title:
             title = href
-        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+        title_part = _title_part(title)
         return (
             "%s[%s](%s%s)%s" % (prefix, text, href, title_part, suffix)
             if href
@@ -94,7 +108,7 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
         alt = el.attrs.get("alt", None) or ""
         src = el.attrs.get("src", None) or ""
         title = el.attrs.get("title", None) or ""
-        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+        title_part = _title_part(title)
         if (
             convert_as_inline
             and el.parent.name not in self.options["keep_inline_images_in"]
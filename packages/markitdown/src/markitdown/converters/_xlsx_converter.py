@@ -32,6 +32,13 @@ ACCEPTED_XLS_MIME_TYPE_PREFIXES = [
 ]
 ACCEPTED_XLS_FILE_EXTENSIONS = [".xls"]
 
+# Precomputed lookup forms: set membership for extensions, and tuples so
+# str.startswith checks all MIME prefixes in a single C-level call
+_ACCEPTED_XLSX_EXTENSIONS = frozenset(ACCEPTED_XLSX_FILE_EXTENSIONS)
+_ACCEPTED_XLSX_MIME_PREFIXES = tuple(ACCEPTED_XLSX_MIME_TYPE_PREFIXES)
+_ACCEPTED_XLS_EXTENSIONS = frozenset(ACCEPTED_XLS_FILE_EXTENSIONS)
+_ACCEPTED_XLS_MIME_PREFIXES = tuple(ACCEPTED_XLS_MIME_TYPE_PREFIXES)
+
 
 class XlsxConverter(DocumentConverter):
     """
@@ -51,12 +58,11 @@ class XlsxConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if extension in ACCEPTED_XLSX_FILE_EXTENSIONS:
+        if extension in _ACCEPTED_XLSX_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_XLSX_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(_ACCEPTED_XLSX_MIME_PREFIXES):
+            return True
 
         return False
 
@@ -113,12 +119,11 @@ class XlsConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if extension in ACCEPTED_XLS_FILE_EXTENSIONS:
+        if extension in _ACCEPTED_XLS_EXTENSIONS:
             return True
 
-        for prefix in ACCEPTED_XLS_MIME_TYPE_PREFIXES:
-            if mimetype.startswith(prefix):
-                return True
+        if mimetype.startswith(_ACCEPTED_XLS_MIME_PREFIXES):
+            return True
 
         return False
 
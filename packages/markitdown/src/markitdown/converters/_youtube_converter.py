@@ -1,5 +1,6 @@
 import sys
 import json
+import logging
 import time
 import io
 import re
@@ -10,6 +11,8 @@ from urllib.parse import parse_qs, urlparse, unquote
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 
+logger = logging.getLogger(__name__)
+
 # Optional YouTube transcription support
 try:
     # Suppress some warnings on library import
@@ -114,8 +117,7 @@ class YouTubeConverter(DocumentConverter):
                             metadata["description"] = str(attrdesc.get("content", ""))
                     break
         except Exception as e:
-            print(f"Error extracting description: {e}")
-            pass
+            logger.debug("Error extracting description: %s", e)
 
         # Start preparing the page
         webpage_text = "# YouTube\n"
@@ -170,7 +172,7 @@ class YouTubeConverter(DocumentConverter):
                             [part.text for part in transcript]
                         )  # type: ignore
                 except Exception as e:
-                    print(f"Error fetching transcript: {e}")
+                    logger.debug("Error fetching transcript: %s", e)
             if transcript_text:
                 webpage_text += f"\n### Transcript\n{transcript_text}\n"
 
@@ -216,7 +218,7 @@ class YouTubeConverter(DocumentConverter):
             try:
                 return operation()  # Attempt the operation
             except Exception as e:
-                print(f"Attempt {attempt + 1} failed: {e}")
+                logger.debug("Attempt %d failed: %s", attempt + 1, e)
                 if attempt < retries - 1:
                     time.sleep(delay)  # Wait before retrying
                 attempt += 1
@@ -276,6 +276,20 @@ def test_docx_equations() -> None:
     assert block_equations, "No block equations found in the document."
 
 
+def test_docx_image_extraction_fast_reject(tmp_path) -> None:
+    from markitdown.converters._docx_converter import DocxConverter
+
+    converter = DocxConverter()
+    html = '<p>No images here</p><img src="regular.png" alt="x" />'
+    assets_folder = os.path.join(str(tmp_path), "assets")
+
+    # Without a data:image payload the HTML must come back unchanged and
+    # no asset directory should be created
+    result = converter._extract_and_save_images(html, "doc", assets_folder)
+    assert result == html
+    assert not os.path.exists(assets_folder)
+
+
 def test_input_as_strings() -> None:
     markitdown = MarkItDown()
 